@@ -0,0 +1,106 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Native ISO19794 record scan for binary CBEFF.
+
+Compiled counterpart of bio_utils_client._scan_iso_record, used
+automatically when built:
+
+    python setup.py build_ext --inplace
+"""
+
+from libc.stdint cimport uint32_t
+from libc.string cimport memchr, memcmp
+
+# Signatures in order of precedence with their modality index,
+# must match the order of _ISO_SIGNATURES in bio_utils_client
+cdef tuple _SIGNATURES = (
+    (0, b'ISO19794-4'), (0, b'FMR'),
+    (1, b'ISO19794-6'), (1, b'IRI'),
+    (2, b'ISO19794-5'), (2, b'FAC'),
+)
+cdef enum:
+    SIGNATURE_COUNT = 6
+    SCAN_WINDOW = 100
+
+
+cdef Py_ssize_t _find(const unsigned char *buf, Py_ssize_t size,
+                      const unsigned char *pattern, Py_ssize_t pattern_len,
+                      Py_ssize_t start) nogil:
+    """Offset of pattern in buf at or after start, or -1"""
+    cdef const unsigned char *hit
+    cdef Py_ssize_t pos = start
+    while pos + pattern_len <= size:
+        hit = <const unsigned char *>memchr(buf + pos, pattern[0], size - pattern_len + 1 - pos)
+        if hit == NULL:
+            return -1
+        pos = hit - buf
+        if memcmp(hit, pattern, pattern_len) == 0:
+            return pos
+        pos += 1
+    return -1
+
+
+cpdef object scan_iso_record(const unsigned char[::1] data):
+    """
+    Find a length prefixed ISO19794 record by its format signature.
+
+    Returns:
+        Tuple of (offset, length, modality_index), or None if no record was found
+    """
+    cdef Py_ssize_t size = data.shape[0]
+    cdef Py_ssize_t limit = size - SCAN_WINDOW
+    if limit <= 0:
+        return None
+
+    cdef const unsigned char *buf = &data[0]
+    cdef const unsigned char *patterns[SIGNATURE_COUNT]
+    cdef Py_ssize_t lengths[SIGNATURE_COUNT]
+    cdef int modalities[SIGNATURE_COUNT]
+    cdef Py_ssize_t next_hit[SIGNATURE_COUNT]
+    cdef Py_ssize_t offset = 0, skip_to, pos, window_start
+    cdef uint32_t record_length
+    cdef int k, modality
+    cdef bytes signature
+
+    for k in range(SIGNATURE_COUNT):
+        modalities[k] = _SIGNATURES[k][0]
+        signature = _SIGNATURES[k][1]
+        patterns[k] = signature
+        lengths[k] = len(signature)
+
+    with nogil:
+        # Next occurrence of each signature at or after the current offset
+        for k in range(SIGNATURE_COUNT):
+            next_hit[k] = _find(buf, size, patterns[k], lengths[k], 0)
+
+        while offset < limit:
+            modality = -1
+            skip_to = limit
+            for k in range(SIGNATURE_COUNT):
+                pos = next_hit[k]
+                if 0 <= pos < offset:
+                    pos = _find(buf, size, patterns[k], lengths[k], offset)
+                    next_hit[k] = pos
+                if pos == -1:
+                    continue
+                # First offset whose window holds this occurrence
+                window_start = pos + lengths[k] - SCAN_WINDOW
+                if window_start <= offset:
+                    modality = modalities[k]
+                    break
+                if window_start < skip_to:
+                    skip_to = window_start
+
+            if modality == -1:
+                offset = skip_to
+                continue
+
+            # ISO19794 records have big-endian length fields
+            record_length = ((<uint32_t>buf[offset] << 24) | (<uint32_t>buf[offset + 1] << 16) |
+                             (<uint32_t>buf[offset + 2] << 8) | <uint32_t>buf[offset + 3])
+            if 0 < record_length and <Py_ssize_t>record_length < size - offset:
+                with gil:
+                    return offset, record_length, modality
+            offset += 1
+
+    return None
@@ -7,14 +7,283 @@ Converts ISO19794 biometric data to JPEG/PNG images.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
+import io
 import json
+import mmap
+import os
 import struct
 import re
-import xml.etree.ElementTree as ET
-from typing import Optional, Dict, Any, Tuple
+import stat
+import string
+import sys
+import threading
+import time
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, BinaryIO, Iterator, List, Tuple, Union
 from pathlib import Path
 
+# pybase64 uses SIMD (AVX2/NEON) kernels and is API compatible with base64
+try:
+    import pybase64 as _b64
+    _b64encode_str = _b64.b64encode_as_string
+except ImportError:
+    _b64 = base64
+
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+# Compiled ISO19794 record scan, see _cbeff_parse.pyx
+try:
+    from _cbeff_parse import scan_iso_record as _native_scan_iso_record
+except ImportError:
+    _native_scan_iso_record = None
+
+# XML module, imported on first use so that binary CBEFF and ISO conversions
+# do not pay for it. _XML_PARSER is only set when lxml is available
+_ET = None
+_XML_PARSER = None
+
+
+def _et():
+    """
+    Return the XML module, importing it on first use.
+    
+    lxml (libxml2) parses large CBEFF documents considerably faster than
+    ElementTree, which is used when lxml is not installed. Both provide
+    ParseError for malformed documents.
+    """
+    global _ET, _XML_PARSER
+    if _ET is None:
+        try:
+            from lxml import etree
+            # huge_tree lifts the libxml2 10 MB text node limit that large
+            # face BDBs exceed, entities stay unresolved and offline
+            _XML_PARSER = etree.XMLParser(
+                huge_tree=True, resolve_entities=False, no_network=True,
+                collect_ids=False, remove_blank_text=True, remove_comments=True
+            )
+        except ImportError:
+            import xml.etree.ElementTree as etree
+        _ET = etree
+    return _ET
+
+
+def __getattr__(name):
+    # Module level ET and ParseError are resolved lazily
+    if name == 'ET':
+        return _et()
+    if name == 'ParseError':
+        return _et().ParseError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _xml_fromstring(xml_data):
+    """Parse XML from str or bytes with the fastest available parser"""
+    ET = _et()
+    if _XML_PARSER is None:
+        return ET.fromstring(xml_data)
+    if isinstance(xml_data, str):
+        # lxml rejects str input carrying an encoding declaration
+        xml_data = xml_data.encode('utf-8')
+    return ET.fromstring(xml_data, _XML_PARSER)
+
+
+# Every byte outside the base64 alphabet (A-Z, a-z, 0-9, +, /, =)
+_B64_ALPHABET = (string.ascii_letters + string.digits + '+/=').encode('ascii')
+_B64_DELETE = bytes(c for c in range(256) if c not in _B64_ALPHABET)
+
+# Big-endian uint32 read at an offset, without slicing
+_read_u32 = struct.Struct('>I').unpack_from
+
+# ISO19794 signatures searched for in binary CBEFF, in order of precedence
+_ISO_SIGNATURES = (
+    ("FINGER", (b'ISO19794-4', b'\x46\x4D\x52')),  # FMR (Finger Minutia Record)
+    ("IRIS", (b'ISO19794-6', b'\x49\x52\x49')),    # IRI (Iris Image)
+    ("FACE", (b'ISO19794-5', b'\x46\x41\x43')),    # FAC (Face Image)
+)
+_SCAN_WINDOW = 100
+
+# Default concurrent requests when converting without the batch endpoint
+_MAX_WORKERS = 8
+
+# Seconds a healthy health check result is reused
+_HEALTH_TTL = 5.0
+
+# Keywords identifying the modality in CBEFF type info, in order of precedence
+_MODALITY_KEYWORDS = (
+    ('FINGER', "FINGER"), ('FMR', "FINGER"),
+    ('IRIS', "IRIS"), ('IRI', "IRIS"),
+    ('FACE', "FACE"), ('FAC', "FACE"),
+)
+
+# ISO19794 version for each modality
+_MODALITY_TO_VERSION = {
+    "FINGER": "ISO19794_4_2011",
+    "IRIS": "ISO19794_6_2011",
+    "FACE": "ISO19794_5_2011",
+}
+
+# Subtype characters dropped from, and separator runs collapsed in, output file names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATORS = re.compile(r'[-\s]+')
+
+# First character of a document, the XML declaration must not follow whitespace
+_NON_WHITESPACE = re.compile(rb'\S')
+
+# CBEFF element names looked up inside each BIR
+_CBEFF_TAGS = ('BIR', 'BDBInfo', 'BDB', 'Type', 'Subtype')
+
+
+def _scan_iso_record(data: bytes) -> Optional[Tuple[bytes, str]]:
+    """
+    Find a length prefixed ISO19794 record by its format signature.
+    
+    Every offset whose following 100 byte window contains a signature is
+    tried as the start of the record. Signatures are located with bytes.find,
+    so offsets with no signature in range are skipped entirely.
+    
+    Returns:
+        Tuple of (iso_bytes, modality), or None if no record was found
+    """
+    if _native_scan_iso_record is not None:
+        found = _native_scan_iso_record(data)
+        if found is None:
+            return None
+        offset, record_length, modality_index = found
+        return data[offset:offset+record_length], _ISO_SIGNATURES[modality_index][0]
+    
+    size = len(data)
+    limit = size - _SCAN_WINDOW
+    # Next occurrence of each signature at or after the current offset
+    next_hit = {sig: data.find(sig) for _, sigs in _ISO_SIGNATURES for sig in sigs}
+    
+    offset = 0
+    while offset < limit:
+        modality = None
+        skip_to = limit
+        for name, sigs in _ISO_SIGNATURES:
+            for sig in sigs:
+                pos = next_hit[sig]
+                if 0 <= pos < offset:
+                    pos = next_hit[sig] = data.find(sig, offset)
+                if pos == -1:
+                    continue
+                # First offset whose window holds this occurrence
+                window_start = pos + len(sig) - _SCAN_WINDOW
+                if window_start <= offset:
+                    modality = name
+                    break
+                skip_to = min(skip_to, window_start)
+            if modality:
+                break
+        
+        if modality is None:
+            offset = skip_to
+            continue
+        
+        # ISO19794 records have length fields
+        record_length = _read_u32(data, offset)[0]
+        if 0 < record_length < size - offset:
+            return data[offset:offset+record_length], modality
+        offset += 1
+    
+    return None
+
+
+def _detect_modality(type_text: str) -> Optional[str]:
+    """Map upper-cased CBEFF type text to FINGER, IRIS or FACE"""
+    return next((modality for keyword, modality in _MODALITY_KEYWORDS if keyword in type_text), None)
+
+
+def _extract_namespace(root) -> Optional[str]:
+    """Get the namespace URI of the root element, if any"""
+    if root.tag.startswith('{'):
+        return root.tag[1:root.tag.index('}')]
+    return None
+
+
+@lru_cache(maxsize=16)
+def _qnames(namespace: Optional[str]) -> Dict[str, str]:
+    """
+    Get CBEFF tag names qualified with a namespace.
+    
+    Maps each tag to its direct child path and './/' + tag to its
+    descendant path.
+    """
+    prefix = f'{{{namespace}}}' if namespace else ''
+    qnames = {}
+    for tag in _CBEFF_TAGS:
+        # Interned so tag and path cache comparisons can match by identity
+        qnames[tag] = sys.intern(prefix + tag)
+        qnames['.//' + tag] = sys.intern('.//' + prefix + tag)
+    return qnames
+
+
+def _find_birs(root, namespace: Optional[str]) -> List:
+    """Find all BIR elements below the root element"""
+    return root.findall(_qnames(namespace)['.//BIR'])
+
+
+def _iterparse_birs(xml_data) -> Iterator:
+    """
+    Stream the BIR elements below the root element of a CBEFF XML document.
+    
+    Each BIR is yielded once fully parsed and cleared when the caller moves
+    on, so the whole document is never held in memory at once.
+    """
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode('utf-8')
+    
+    # File objects such as a mapped file are read by the parser directly
+    source = xml_data if hasattr(xml_data, 'read') else io.BytesIO(xml_data)
+    ET = _et()
+    if _XML_PARSER is not None:
+        # libxml2 filters the events down to BIR elements
+        context = ET.iterparse(
+            source,
+            events=('end',),
+            tag='{*}BIR',
+            huge_tree=True,
+            resolve_entities=False,
+            no_network=True,
+            collect_ids=False,
+            remove_blank_text=True,
+            remove_comments=True
+        )
+        for _, elem in context:
+            # Skip the root BIR wrapping the others
+            if elem.getparent() is None:
+                continue
+            
+            yield elem
+            
+            # Free the BIR and the already processed siblings before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+    
+    root = None
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if root is None:
+            root = elem
+            continue
+        
+        if event != 'end' or elem is root:
+            continue
+        
+        # BIRs in any namespace, like the '{*}BIR' filter above
+        if elem.tag != 'BIR' and not elem.tag.endswith('}BIR'):
+            continue
+        
+        yield elem
+        
+        elem.clear()
+
 
 class BioUtilsClient:
     """
@@ -55,23 +324,176 @@ class BioUtilsClient:
         # Save image
         with open("fingerprint.jpg", "wb") as f:
             f.write(image_bytes)
+    
+    Example 3: Convert several ISO files concurrently from asyncio code:
+        async def convert_all(client):
+            await asyncio.gather(
+                client.convert_from_file_async("finger.iso", "FINGER", "ISO19794_4_2011", "finger.jpg"),
+                client.convert_from_file_async("iris.iso", "IRIS", "ISO19794_6_2011", "iris.jpg"),
+                client.convert_from_file_async("face.iso", "FACE", "ISO19794_5_2011", "face.jpg")
+            )
+        
+        with BioUtilsClient(base_url="http://localhost:8080") as client:
+            asyncio.run(convert_all(client))
     """
     
-    def __init__(self, base_url: str = "http://localhost:8080", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        timeout: int = 30,
+        max_workers: int = _MAX_WORKERS
+    ):
         """
         Initialize the Bio Utils client
         
         Args:
             base_url: Base URL of the Bio Utils REST service
             timeout: Request timeout in seconds
+            max_workers: Maximum concurrent requests when converting several
+                         records without the batch endpoint (default 8)
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.max_workers = max_workers
+        
+        # Service endpoints
+        self._convert_url = f"{self.base_url}/bio-utils/iso-to-image"
+        self._raw_url = f"{self._convert_url}/raw"
+        self._batch_url = f"{self._convert_url}/batch"
+        self._health_url = f"{self.base_url}/bio-utils/health"
+        
         self.session = requests.Session()
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
+        
+        # Keep-alive connection pool shared by all requests, large enough
+        # that concurrent conversions never wait for a connection
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max(64, max_workers),
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._raw_supported = True
+        self._batch_supported = True
+        
+        # Last healthy health check result with the time it was made
+        self._health = None
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self) -> "BioUtilsClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _parse_bir_element(self, bir) -> Tuple[bytes, str, str, Optional[str]]:
+        """
+        Extract ISO bytes, modality, ISO version and subtype from a BIR element.
+        
+        Args:
+            bir: Parsed BIR element
+        
+        Returns:
+            Tuple of (iso_bytes, modality, iso_version, subtype)
+            - subtype: Subtype text from BDBInfo, or None if missing
+        
+        Raises:
+            ValueError: If the BIR has no usable BDB or modality
+        """
+        bdb_text, modality, iso_version, subtype = self._read_bir_element(bir)
+        
+        # Decode base64 to get ISO bytes. Whitespace such as line wrapping is
+        # dropped first, without a copy if there is none, and any other
+        # character outside the base64 alphabet is rejected
+        try:
+            iso_bytes = _b64.b64decode("".join(bdb_text.split()), validate=True)
+        except Exception as e:
+            raise ValueError(f"Failed to decode BDB base64 data: {str(e)}")
+        
+        if len(iso_bytes) == 0:
+            raise ValueError("BDB contains no data")
+        
+        return iso_bytes, modality, iso_version, subtype
+    
+    def _read_bir_element(
+        self,
+        bir,
+        q: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, str, str, Optional[str]]:
+        """
+        Extract BDB text, modality, ISO version and subtype from a BIR element
+        without decoding the BDB.
+        
+        Args:
+            bir: Parsed BIR element
+            q: Qualified tag names for the BIR namespace, resolved from the
+               BIR if not given
+        
+        Returns:
+            Tuple of (bdb_text, modality, iso_version, subtype)
+            - bdb_text: Base64 encoded ISO bytes as found in the BDB element
+        
+        Raises:
+            ValueError: If the BIR has no BDB or modality
+        """
+        if q is None:
+            q = _qnames(_extract_namespace(bir))
+        
+        # Find BDBInfo to get modality and subtype
+        bdbinfo = bir.find(q['.//BDBInfo'])
+        
+        modality = None
+        subtype = None
+        if bdbinfo is not None:
+            # Find Type element within BDBInfo (try direct child first, then descendant)
+            type_elem = bdbinfo.find(q['Type'])
+            if type_elem is None:
+                type_elem = bdbinfo.find(q['.//Type'])
+            
+            if type_elem is not None and type_elem.text:
+                # Map common type names to modality
+                modality = _detect_modality(type_elem.text.strip().upper())
+            
+            subtype_elem = bdbinfo.find(q['Subtype'])
+            if subtype_elem is None:
+                subtype_elem = bdbinfo.find(q['.//Subtype'])
+            
+            if subtype_elem is not None and subtype_elem.text:
+                subtype = subtype_elem.text.strip()
+                # Handle "None" as empty
+                if subtype.upper() == "NONE" or not subtype:
+                    subtype = None
+        
+        # Find BDB element containing base64 encoded ISO bytes
+        bdb = bir.find(q['.//BDB'])
+        
+        if bdb is None or not bdb.text:
+            raise ValueError("No BDB element found or BDB is empty in CBEFF XML")
+        
+        if modality is None:
+            raise ValueError(
+                "Could not detect modality from CBEFF XML. "
+                "Please specify modality explicitly or ensure BDBInfo contains Type information."
+            )
+        
+        # Determine ISO version from modality
+        iso_version = _MODALITY_TO_VERSION.get(modality, "ISO19794_4_2011")
+        
+        return bdb.text, modality, iso_version, subtype
     
     def parse_cbeff_xml(
         self,
-        cbeff_xml: str
+        cbeff_xml: Any
     ) -> Tuple[bytes, str, str]:
         """
         Parse CBEFF XML file to extract ISO bytes, modality, and ISO version.
@@ -81,7 +503,7 @@ class BioUtilsClient:
         - <BIR> contains <BDBInfo> with <Type> (modality) and <BDB> (base64 encoded ISO bytes)
         
         Args:
-            cbeff_xml: CBEFF XML content as string
+            cbeff_xml: CBEFF XML content as string, or an already parsed root element
         
         Returns:
             Tuple of (iso_bytes, modality, iso_version)
@@ -93,63 +515,19 @@ class BioUtilsClient:
             ValueError: If CBEFF XML parsing fails
         """
         try:
-            # Parse XML
-            root = ET.fromstring(cbeff_xml)
+            # Parse XML unless given an element
+            if isinstance(cbeff_xml, (str, bytes)):
+                root = _xml_fromstring(cbeff_xml)
+            else:
+                root = cbeff_xml
             
             # Extract namespace from root element if present
-            namespace = None
-            if root.tag.startswith('{'):
-                namespace = root.tag[1:root.tag.index('}')]
-            
-            # Define namespace map for find operations
-            ns_map = {}
-            if namespace:
-                ns_map['ns'] = namespace
-            
-            # Helper function to find elements with or without namespace
-            def find_with_ns(parent, tag, direct_child=False):
-                """Find element handling namespace"""
-                # Try direct child first if requested, then descendants
-                search_paths = []
-                if direct_child:
-                    # Direct child paths
-                    if namespace:
-                        search_paths.append(f'{{{namespace}}}{tag}')
-                        if ns_map:
-                            search_paths.append(f'ns:{tag}')
-                    search_paths.append(tag)
-                else:
-                    # Descendant paths (default)
-                    if namespace:
-                        search_paths.append(f'.//{{{namespace}}}{tag}')
-                        if ns_map:
-                            search_paths.append(f'.//ns:{tag}')
-                    search_paths.append(f'.//{tag}')
-                
-                # Try all search paths
-                for path in search_paths:
-                    if ns_map and 'ns:' in path:
-                        result = parent.find(path, ns_map)
-                    else:
-                        result = parent.find(path)
-                    if result is not None:
-                        return result
-                return None
+            namespace = _extract_namespace(root)
+            q = _qnames(namespace)
             
             # Find all BIR elements (nested BIR elements inside root BIR)
             # The root might be BIR, and there might be nested BIR elements
-            bir_elements = []
-            
-            # Try with full namespace URL format (most reliable)
-            if namespace:
-                bir_elements = root.findall(f'.//{{{namespace}}}BIR')
-                if not bir_elements and ns_map:
-                    # Try with namespace prefix as fallback
-                    bir_elements = root.findall('.//ns:BIR', ns_map)
-            
-            # Try without namespace
-            if not bir_elements:
-                bir_elements = root.findall('.//BIR')
+            bir_elements = _find_birs(root, namespace)
             
             # If root itself is BIR, include it
             if root.tag.endswith('BIR') or root.tag == 'BIR':
@@ -163,8 +541,8 @@ class BioUtilsClient:
             # (skip the root BIR if it only contains nested BIRs)
             bir = None
             for bir_candidate in bir_elements:
-                bdbinfo_test = find_with_ns(bir_candidate, 'BDBInfo')
-                bdb_test = find_with_ns(bir_candidate, 'BDB')
+                bdbinfo_test = bir_candidate.find(q['.//BDBInfo'])
+                bdb_test = bir_candidate.find(q['.//BDB'])
                 if bdbinfo_test is not None and bdb_test is not None:
                     bir = bir_candidate
                     break
@@ -173,69 +551,16 @@ class BioUtilsClient:
             if bir is None:
                 bir = bir_elements[0]
             
-            # Find BDBInfo to get modality
-            bdbinfo = find_with_ns(bir, 'BDBInfo')
-            
-            modality = None
-            if bdbinfo is not None:
-                # Find Type element within BDBInfo (try direct child first, then descendant)
-                type_elem = find_with_ns(bdbinfo, 'Type', direct_child=True)
-                if type_elem is None:
-                    type_elem = find_with_ns(bdbinfo, 'Type', direct_child=False)
-                
-                if type_elem is not None and type_elem.text:
-                    type_text = type_elem.text.strip().upper()
-                    # Map common type names to modality
-                    if 'FINGER' in type_text or 'FMR' in type_text:
-                        modality = "FINGER"
-                    elif 'IRIS' in type_text or 'IRI' in type_text:
-                        modality = "IRIS"
-                    elif 'FACE' in type_text or 'FAC' in type_text:
-                        modality = "FACE"
-            
-            # Find BDB element containing base64 encoded ISO bytes
-            bdb = find_with_ns(bir, 'BDB')
-            
-            if bdb is None or not bdb.text:
-                raise ValueError("No BDB element found or BDB is empty in CBEFF XML")
-            
-            # Extract base64 data from BDB
-            bdb_base64 = bdb.text.strip()
+            iso_bytes, modality, iso_version, _ = self._parse_bir_element(bir)
             
-            # Decode base64 to get ISO bytes
-            try:
-                iso_bytes = base64.b64decode(bdb_base64, validate=True)
-            except Exception as e:
-                raise ValueError(f"Failed to decode BDB base64 data: {str(e)}")
-            
-            if len(iso_bytes) == 0:
-                raise ValueError("BDB contains no data")
+            return iso_bytes, modality, iso_version
             
-            if modality is None:
-                raise ValueError(
-                    "Could not detect modality from CBEFF XML. "
-                    "Please specify modality explicitly or ensure BDBInfo contains Type information."
-                )
-            
-            # Determine ISO version from modality
-            iso_version = "ISO19794_4_2011"  # Default
-            if modality == "IRIS":
-                iso_version = "ISO19794_6_2011"
-            elif modality == "FACE":
-                iso_version = "ISO19794_5_2011"
-            elif modality == "FINGER":
-                iso_version = "ISO19794_4_2011"
-            
-            return iso_bytes, modality.upper(), iso_version
-            
-        except ET.ParseError as e:
+        except _et().ParseError as e:
             raise ValueError(f"Invalid XML format: {str(e)}")
-        except Exception as e:
-            raise ValueError(f"Failed to parse CBEFF XML: {str(e)}") from e
     
     def parse_cbeff(
         self,
-        cbeff_base64: str
+        cbeff_base64: Union[str, bytes]
     ) -> Tuple[bytes, str, str]:
         """
         Parse CBEFF (Common Biometric Exchange Formats Framework) file
@@ -251,7 +576,8 @@ class BioUtilsClient:
         - BDB (Biometric Data Block) - contains ISO19794 bytes
         
         Args:
-            cbeff_base64: Base64 encoded CBEFF file OR CBEFF XML content as string
+            cbeff_base64: Base64 encoded CBEFF file OR CBEFF XML content,
+                          as string or bytes
         
         Returns:
             Tuple of (iso_bytes, modality, iso_version)
@@ -262,236 +588,223 @@ class BioUtilsClient:
         Raises:
             ValueError: If CBEFF parsing fails
         """
-        # Check if input is XML (starts with <?xml or <BIR)
-        cbeff_stripped = cbeff_base64.strip()
-        if cbeff_stripped.startswith('<?xml') or cbeff_stripped.startswith('<BIR'):
+        # Check if input is XML (starts with <?xml or <BIR). lstrip only
+        # copies the input if there is leading whitespace to drop
+        cbeff_content = cbeff_base64.lstrip()
+        xml_starts = (b'<?xml', b'<BIR') if isinstance(cbeff_content, bytes) else ('<?xml', '<BIR')
+        if cbeff_content.startswith(xml_starts):
             # It's XML format, parse directly
-            return self.parse_cbeff_xml(cbeff_base64)
+            return self.parse_cbeff_xml(cbeff_content)
         
         # Otherwise, treat as base64 encoded binary CBEFF
+        # Clean base64 (the common case) decodes directly in a single pass
+        cbeff_bytes = None
         try:
-            # Clean and prepare base64 string
-            # Base64 characters: A-Z, a-z, 0-9, +, /, = (padding)
-            # Remove all whitespace and non-base64 characters
-            # Remove all whitespace first
-            cbeff_base64_clean = ''.join(cbeff_base64.split())
-            # Keep only valid base64 characters (A-Z, a-z, 0-9, +, /, =)
-            cbeff_base64_clean = re.sub(r'[^A-Za-z0-9+/=]', '', cbeff_base64_clean)
-            
-            if not cbeff_base64_clean:
-                raise ValueError("CBEFF file appears to be empty or contains no valid base64 characters")
-            
-            # Remove padding characters temporarily to check length
-            # Then add correct padding
-            base64_without_padding = cbeff_base64_clean.rstrip('=')
-            missing_padding = len(base64_without_padding) % 4
-            if missing_padding:
-                cbeff_base64_clean = base64_without_padding + '=' * (4 - missing_padding)
+            cbeff_bytes = _b64.b64decode(cbeff_base64, validate=True)
+        except Exception:
+            pass
+        
+        if not cbeff_bytes:
+            cbeff_bytes = self._decode_unclean_base64(cbeff_base64)
+        
+        if len(cbeff_bytes) < 8:
+            raise ValueError("CBEFF file too short")
+        
+        # CBEFF typically starts with format identifier
+        # Common structure: [Format ID (4 bytes)] [Version] [SBH Length] [SBH] [BDB Length] [BDB]
+        
+        # Try to find BDB (Biometric Data Block)
+        # BDB usually starts after SBH (Standard Biometric Header)
+        # SBH contains modality information
+        
+        # Method 1: Look for ISO19794 magic numbers/patterns
+        # ISO19794 formats have specific headers:
+        # - Finger: ISO19794-4 format identifier
+        # - Iris: ISO19794-6 format identifier  
+        # - Face: ISO19794-5 format identifier
+        
+        # Try parsing as CBEFF with SBH/BDB structure
+        # CBEFF format: FormatOwner (2 bytes) + FormatType (2 bytes) + Version (1 byte) + ...
+        
+        offset = 0
+        
+        # Read format identifier (first 4 bytes often contain format info)
+        if len(cbeff_bytes) < 4:
+            raise ValueError("Invalid CBEFF: too short")
+        
+        # CBEFF structure can vary, but typically:
+        # - Format Owner (2 bytes)
+        # - Format Type (2 bytes) 
+        # - Version (1 byte)
+        # - Record Count (1 byte)
+        # - SBH Length (4 bytes, big-endian)
+        # - SBH data
+        # - BDB Length (4 bytes, big-endian)
+        # - BDB data (ISO19794 bytes)
+        
+        # Try to locate BDB by looking for ISO19794 patterns
+        # ISO19794 records often start with specific byte patterns
+        
+        # For MOSIP CBEFF, the structure might be:
+        # - Header with format info
+        # - SBH with modality (can be XML or binary)
+        # - BDB with ISO19794 bytes
+        
+        # Simple approach: Try to extract BDB by finding ISO19794 signatures
+        # or by parsing known CBEFF structure
+        
+        # Check if this might be a direct ISO file (not CBEFF)
+        # ISO19794 files have specific format identifiers
+        iso_magic_finger = b'\x46\x4D\x52'  # FMR (Finger Minutia Record)
+        iso_magic_iris = b'\x49\x52\x49'    # IRI (Iris Image)
+        iso_magic_face = b'\x46\x41\x43'    # FAC (Face Image)
+        
+        # Try to find ISO19794 data within CBEFF
+        # Look for BDB section which contains the ISO bytes
+        modality = None
+        iso_bytes = None
+        
+        # Method: Parse CBEFF structure
+        # Many CBEFF implementations have:
+        # - Fixed header (8-16 bytes)
+        # - SBH length (4 bytes)
+        # - SBH data
+        # - BDB length (4 bytes) 
+        # - BDB data
+        
+        # Try parsing as binary CBEFF
+        if len(cbeff_bytes) >= 12:
+            # Try to read lengths (often 4-byte big-endian integers)
+            # Skip header, try to find length fields
             
-            # Decode base64 CBEFF
+            # Look for SBH length (often at offset 8-12)
             try:
-                cbeff_bytes = base64.b64decode(cbeff_base64_clean, validate=True)
-            except Exception as e:
-                # base64.b64decode raises binascii.Error for invalid base64
-                error_msg = str(e)
-                if "base64" in error_msg.lower() or "incorrect padding" in error_msg.lower():
-                    raise ValueError(
-                        f"Invalid base64 encoding: {error_msg}. "
-                        "Make sure the CBEFF file contains valid base64 data. "
-                        "The file should contain only base64 characters (A-Z, a-z, 0-9, +, /, =)."
-                    )
-                else:
-                    raise ValueError(f"Failed to decode base64: {error_msg}")
-            
-            if len(cbeff_bytes) < 8:
-                raise ValueError("CBEFF file too short")
-            
-            # CBEFF typically starts with format identifier
-            # Common structure: [Format ID (4 bytes)] [Version] [SBH Length] [SBH] [BDB Length] [BDB]
-            
-            # Try to find BDB (Biometric Data Block)
-            # BDB usually starts after SBH (Standard Biometric Header)
-            # SBH contains modality information
-            
-            # Method 1: Look for ISO19794 magic numbers/patterns
-            # ISO19794 formats have specific headers:
-            # - Finger: ISO19794-4 format identifier
-            # - Iris: ISO19794-6 format identifier  
-            # - Face: ISO19794-5 format identifier
-            
-            # Try parsing as CBEFF with SBH/BDB structure
-            # CBEFF format: FormatOwner (2 bytes) + FormatType (2 bytes) + Version (1 byte) + ...
-            
-            offset = 0
-            
-            # Read format identifier (first 4 bytes often contain format info)
-            if len(cbeff_bytes) < 4:
-                raise ValueError("Invalid CBEFF: too short")
-            
-            # CBEFF structure can vary, but typically:
-            # - Format Owner (2 bytes)
-            # - Format Type (2 bytes) 
-            # - Version (1 byte)
-            # - Record Count (1 byte)
-            # - SBH Length (4 bytes, big-endian)
-            # - SBH data
-            # - BDB Length (4 bytes, big-endian)
-            # - BDB data (ISO19794 bytes)
-            
-            # Try to locate BDB by looking for ISO19794 patterns
-            # ISO19794 records often start with specific byte patterns
-            
-            # For MOSIP CBEFF, the structure might be:
-            # - Header with format info
-            # - SBH with modality (can be XML or binary)
-            # - BDB with ISO19794 bytes
-            
-            # Simple approach: Try to extract BDB by finding ISO19794 signatures
-            # or by parsing known CBEFF structure
-            
-            # Check if this might be a direct ISO file (not CBEFF)
-            # ISO19794 files have specific format identifiers
-            iso_magic_finger = b'\x46\x4D\x52'  # FMR (Finger Minutia Record)
-            iso_magic_iris = b'\x49\x52\x49'    # IRI (Iris Image)
-            iso_magic_face = b'\x46\x41\x43'    # FAC (Face Image)
-            
-            # Try to find ISO19794 data within CBEFF
-            # Look for BDB section which contains the ISO bytes
-            modality = None
-            iso_bytes = None
-            
-            # Method: Parse CBEFF structure
-            # Many CBEFF implementations have:
-            # - Fixed header (8-16 bytes)
-            # - SBH length (4 bytes)
-            # - SBH data
-            # - BDB length (4 bytes) 
-            # - BDB data
-            
-            # Try parsing as binary CBEFF
-            if len(cbeff_bytes) >= 12:
-                # Try to read lengths (often 4-byte big-endian integers)
-                # Skip header, try to find length fields
-                
-                # Look for SBH length (often at offset 8-12)
-                try:
-                    sbh_length = struct.unpack('>I', cbeff_bytes[8:12])[0]
-                    if 0 < sbh_length < len(cbeff_bytes) - 12:
-                        sbh_start = 12
-                        sbh_end = sbh_start + sbh_length
+                sbh_length = _read_u32(cbeff_bytes, 8)[0]
+                if 0 < sbh_length < len(cbeff_bytes) - 12:
+                    sbh_start = 12
+                    sbh_end = sbh_start + sbh_length
+                    
+                    if sbh_end < len(cbeff_bytes):
+                        # Zero-copy view of the SBH
+                        sbh = memoryview(cbeff_bytes)[sbh_start:sbh_end]
                         
-                        if sbh_end < len(cbeff_bytes):
-                            sbh = cbeff_bytes[sbh_start:sbh_end]
-                            
-                            # Try to extract modality from SBH
-                            # SBH might contain XML or binary format info
-                            sbh_str = sbh.decode('utf-8', errors='ignore')
-                            if 'FINGER' in sbh_str.upper() or 'FMR' in sbh_str.upper():
-                                modality = "FINGER"
-                            elif 'IRIS' in sbh_str.upper() or 'IRI' in sbh_str.upper():
-                                modality = "IRIS"
-                            elif 'FACE' in sbh_str.upper() or 'FAC' in sbh_str.upper():
-                                modality = "FACE"
+                        # Try to extract modality from SBH
+                        # SBH might contain XML or binary format info
+                        sbh_str = str(sbh, 'utf-8', errors='ignore')
+                        modality = _detect_modality(sbh_str.upper())
+                        
+                        # Read BDB length
+                        bdb_length_start = sbh_end
+                        if bdb_length_start + 4 <= len(cbeff_bytes):
+                            bdb_length = _read_u32(cbeff_bytes, bdb_length_start)[0]
+                            bdb_start = bdb_length_start + 4
+                            bdb_end = bdb_start + bdb_length
                             
-                            # Read BDB length
-                            bdb_length_start = sbh_end
-                            if bdb_length_start + 4 <= len(cbeff_bytes):
-                                bdb_length = struct.unpack('>I', cbeff_bytes[bdb_length_start:bdb_length_start+4])[0]
-                                bdb_start = bdb_length_start + 4
-                                bdb_end = bdb_start + bdb_length
-                                
-                                if bdb_end <= len(cbeff_bytes):
-                                    iso_bytes = cbeff_bytes[bdb_start:bdb_end]
-                except:
-                    pass
-            
-            # Fallback: Try to find ISO19794 data by pattern matching
-            if iso_bytes is None:
-                # Look for ISO19794 format identifiers in the data
-                for i in range(len(cbeff_bytes) - 100):
-                    chunk = cbeff_bytes[i:i+100]
-                    
-                    # Check for ISO19794-4 (Finger)
-                    if b'ISO19794-4' in chunk or iso_magic_finger in chunk:
-                        # Try to extract from this position
-                        # ISO19794 records have length fields
-                        if i + 4 < len(cbeff_bytes):
-                            try:
-                                record_length = struct.unpack('>I', cbeff_bytes[i:i+4])[0]
-                                if 0 < record_length < len(cbeff_bytes) - i:
-                                    iso_bytes = cbeff_bytes[i:i+record_length]
-                                    modality = "FINGER"
-                                    break
-                            except:
-                                pass
-                    
-                    # Check for ISO19794-6 (Iris)
-                    elif b'ISO19794-6' in chunk or iso_magic_iris in chunk:
-                        if i + 4 < len(cbeff_bytes):
-                            try:
-                                record_length = struct.unpack('>I', cbeff_bytes[i:i+4])[0]
-                                if 0 < record_length < len(cbeff_bytes) - i:
-                                    iso_bytes = cbeff_bytes[i:i+record_length]
-                                    modality = "IRIS"
-                                    break
-                            except:
-                                pass
-                    
-                    # Check for ISO19794-5 (Face)
-                    elif b'ISO19794-5' in chunk or iso_magic_face in chunk:
-                        if i + 4 < len(cbeff_bytes):
-                            try:
-                                record_length = struct.unpack('>I', cbeff_bytes[i:i+4])[0]
-                                if 0 < record_length < len(cbeff_bytes) - i:
-                                    iso_bytes = cbeff_bytes[i:i+record_length]
-                                    modality = "FACE"
-                                    break
-                            except:
-                                pass
-            
-            # If still not found, assume the entire file is ISO (might be direct ISO, not CBEFF)
-            if iso_bytes is None:
-                # Check if it's a direct ISO file
-                if iso_magic_finger in cbeff_bytes[:100]:
-                    iso_bytes = cbeff_bytes
-                    modality = "FINGER"
-                elif iso_magic_iris in cbeff_bytes[:100]:
-                    iso_bytes = cbeff_bytes
-                    modality = "IRIS"
-                elif iso_magic_face in cbeff_bytes[:100]:
-                    iso_bytes = cbeff_bytes
-                    modality = "FACE"
-                else:
-                    # Last resort: use entire file as ISO, modality must be specified
-                    iso_bytes = cbeff_bytes
-                    raise ValueError(
-                        "Could not automatically detect modality from CBEFF. "
-                        "Please specify modality explicitly or ensure CBEFF contains valid SBH."
-                    )
-            
-            if iso_bytes is None or len(iso_bytes) == 0:
-                raise ValueError("Could not extract ISO bytes from CBEFF")
-            
-            if modality is None:
+                            if bdb_end <= len(cbeff_bytes):
+                                iso_bytes = cbeff_bytes[bdb_start:bdb_end]
+            except:
+                pass
+        
+        # Fallback: Try to find ISO19794 data by pattern matching
+        if iso_bytes is None:
+            record = _scan_iso_record(cbeff_bytes)
+            if record is not None:
+                iso_bytes, modality = record
+        
+        # If still not found, assume the entire file is ISO (might be direct ISO, not CBEFF)
+        if iso_bytes is None:
+            # Check if it's a direct ISO file
+            if cbeff_bytes.find(iso_magic_finger, 0, 100) != -1:
+                iso_bytes = cbeff_bytes
+                modality = "FINGER"
+            elif cbeff_bytes.find(iso_magic_iris, 0, 100) != -1:
+                iso_bytes = cbeff_bytes
+                modality = "IRIS"
+            elif cbeff_bytes.find(iso_magic_face, 0, 100) != -1:
+                iso_bytes = cbeff_bytes
+                modality = "FACE"
+            else:
+                # Last resort: use entire file as ISO, modality must be specified
+                iso_bytes = cbeff_bytes
                 raise ValueError(
-                    "Could not detect modality from CBEFF. "
-                    "Please specify modality explicitly."
+                    "Could not automatically detect modality from CBEFF. "
+                    "Please specify modality explicitly or ensure CBEFF contains valid SBH."
                 )
-            
-            # Determine ISO version from the ISO bytes
-            # ISO19794 versions are typically embedded in the format identifier
-            iso_version = "ISO19794_4_2011"  # Default
-            if modality == "IRIS":
-                iso_version = "ISO19794_6_2011"
-            elif modality == "FACE":
-                iso_version = "ISO19794_5_2011"
-            elif modality == "FINGER":
-                iso_version = "ISO19794_4_2011"
-            
-            return iso_bytes, modality.upper(), iso_version
-            
+        
+        if iso_bytes is None or len(iso_bytes) == 0:
+            raise ValueError("Could not extract ISO bytes from CBEFF")
+        
+        if modality is None:
+            raise ValueError(
+                "Could not detect modality from CBEFF. "
+                "Please specify modality explicitly."
+            )
+        
+        # Determine ISO version from the ISO bytes
+        # ISO19794 versions are typically embedded in the format identifier
+        iso_version = _MODALITY_TO_VERSION.get(modality, "ISO19794_4_2011")
+        
+        # Detected modalities are already upper case
+        return iso_bytes, modality, iso_version
+    
+    def _decode_unclean_base64(self, cbeff_base64: Union[str, bytes]) -> bytes:
+        """
+        Decode base64 containing whitespace, stray characters or bad padding.
+        
+        Raises:
+            ValueError: If no valid base64 remains after cleaning
+        """
+        # Clean and prepare base64 string
+        # Base64 characters: A-Z, a-z, 0-9, +, /, = (padding)
+        # Drop non-ASCII characters, then whitespace and any other
+        # non-base64 characters in a single translate pass
+        if isinstance(cbeff_base64, str):
+            cbeff_base64 = cbeff_base64.encode('ascii', 'ignore')
+        cbeff_base64_clean = cbeff_base64.translate(None, _B64_DELETE)
+        
+        if not cbeff_base64_clean:
+            raise ValueError("CBEFF file appears to be empty or contains no valid base64 characters")
+        
+        # Remove padding characters temporarily to check length
+        # Then add correct padding
+        base64_without_padding = cbeff_base64_clean.rstrip(b'=')
+        missing_padding = -len(base64_without_padding) & 3
+        if missing_padding:
+            cbeff_base64_clean = base64_without_padding + b'=' * missing_padding
+        
+        # Decode base64 CBEFF
+        try:
+            return _b64.b64decode(cbeff_base64_clean, validate=True)
         except Exception as e:
-            raise ValueError(f"Failed to parse CBEFF: {str(e)}") from e
+            # b64decode raises binascii.Error for invalid base64
+            error_msg = str(e)
+            if "base64" in error_msg.lower() or "incorrect padding" in error_msg.lower():
+                raise ValueError(
+                    f"Invalid base64 encoding: {error_msg}. "
+                    "Make sure the CBEFF file contains valid base64 data. "
+                    "The file should contain only base64 characters (A-Z, a-z, 0-9, +, /, =)."
+                )
+            else:
+                raise ValueError(f"Failed to decode base64: {error_msg}")
+    
+    def _validate_request(self, modality: str, compression_ratio: int) -> str:
+        """
+        Validate conversion parameters.
+        
+        Returns:
+            Upper case modality
+        
+        Raises:
+            ValueError: If the modality or compression ratio is invalid
+        """
+        modality_upper = modality.upper()
+        if modality_upper not in ["FINGER", "IRIS", "FACE"]:
+            raise ValueError(f"Unsupported modality: {modality}. Must be FINGER, IRIS, or FACE")
+        
+        if not (1 <= compression_ratio <= 100):
+            raise ValueError(f"Compression ratio must be between 1 and 100, got {compression_ratio}")
+        
+        return modality_upper
     
     def convert_iso_to_image(
         self,
@@ -500,7 +813,7 @@ class BioUtilsClient:
         iso_bytes: bytes,
         compression_ratio: int = 95,
         output_path: Optional[str] = None
-    ) -> bytes:
+    ) -> Optional[bytes]:
         """
         Convert ISO19794 bytes to JPEG/PNG image
         
@@ -509,61 +822,135 @@ class BioUtilsClient:
             iso_version: ISO version (e.g., ISO19794_4_2011, ISO19794_6_2011)
             iso_bytes: ISO19794 binary data
             compression_ratio: Compression ratio (1-100, default 95)
-            output_path: Optional path to save the image file
+            output_path: Optional path to save the image file. The response is
+                         streamed straight to this file instead of into memory.
         
         Returns:
-            Image bytes (JPEG/PNG)
+            Image bytes (JPEG/PNG), or None if the image was saved to output_path
         
         Raises:
             requests.RequestException: If the request fails
             ValueError: If the response is invalid
         """
         # Validate inputs
-        modality_upper = modality.upper()
-        if modality_upper not in ["FINGER", "IRIS", "FACE"]:
-            raise ValueError(f"Unsupported modality: {modality}. Must be FINGER, IRIS, or FACE")
+        modality_upper = self._validate_request(modality, compression_ratio)
         
-        if not (1 <= compression_ratio <= 100):
-            raise ValueError(f"Compression ratio must be between 1 and 100, got {compression_ratio}")
+        if self._raw_supported:
+            # Send ISO bytes as the raw body, avoiding the Base64 overhead
+            try:
+                response = self.session.post(
+                    self._raw_url,
+                    data=iso_bytes,
+                    params={
+                        "modality": modality_upper,
+                        "isoVersion": iso_version,
+                        "compressionRatio": compression_ratio
+                    },
+                    timeout=self.timeout,
+                    headers={"Content-Type": "application/octet-stream"},
+                    stream=bool(output_path)
+                )
+            except requests.exceptions.RequestException as e:
+                raise requests.RequestException(
+                    f"Request failed: {str(e)}"
+                ) from e
+            
+            # Older services only provide the JSON endpoint
+            if response.status_code not in (404, 405, 415):
+                return self._receive_image(response, output_path)
+            
+            self._raw_supported = False
+            response.close()
+        
+        return self.convert_iso_b64_to_image(
+            modality_upper, iso_version, _b64encode_str(iso_bytes),
+            compression_ratio, output_path
+        )
+    
+    def convert_iso_b64_to_image(
+        self,
+        modality: str,
+        iso_version: str,
+        iso_b64: str,
+        compression_ratio: int = 95,
+        output_path: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        Convert Base64 encoded ISO19794 data to JPEG/PNG image
+        
+        The Base64 text is sent to the service as is, so data that is
+        already Base64 encoded (such as a CBEFF BDB) is never decoded
+        and re-encoded on the client.
+        
+        Args:
+            modality: Biometric modality (FINGER, IRIS, or FACE)
+            iso_version: ISO version (e.g., ISO19794_4_2011, ISO19794_6_2011)
+            iso_b64: Base64 encoded ISO19794 data without line breaks
+            compression_ratio: Compression ratio (1-100, default 95)
+            output_path: Optional path to save the image file. The response is
+                         streamed straight to this file instead of into memory.
+        
+        Returns:
+            Image bytes (JPEG/PNG), or None if the image was saved to output_path
         
-        # Encode ISO bytes to Base64
-        iso_base64 = base64.b64encode(iso_bytes).decode('utf-8')
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the response is invalid
+        """
+        # Validate inputs
+        modality_upper = self._validate_request(modality, compression_ratio)
         
         # Prepare request payload
         payload = {
             "modality": modality_upper,
             "isoVersion": iso_version,
-            "isoBase64": iso_base64,
+            "isoBase64": iso_b64,
             "compressionRatio": compression_ratio
         }
         
-        # Make request
-        url = f"{self.base_url}/bio-utils/iso-to-image"
-        
         try:
             response = self.session.post(
-                url,
+                self._convert_url,
                 json=payload,
                 timeout=self.timeout,
-                headers={"Content-Type": "application/json"}
+                stream=bool(output_path)
             )
-            
+        except requests.exceptions.RequestException as e:
+            raise requests.RequestException(
+                f"Request failed: {str(e)}"
+            ) from e
+        
+        return self._receive_image(response, output_path)
+    
+    def _receive_image(
+        self,
+        response: requests.Response,
+        output_path: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        Read the image from a conversion response, streaming it to
+        output_path if given.
+        
+        Raises:
+            requests.RequestException: If the request failed
+            ValueError: If the response is empty
+        """
+        try:
             # Check for errors
             response.raise_for_status()
             
+            # Stream to file if output path is provided
+            if output_path:
+                self._stream_to_file(response, Path(output_path))
+                print(f"Image saved to: {output_path}")
+                return None
+            
             # Get image bytes
             image_bytes = response.content
             
             if not image_bytes:
                 raise ValueError("Received empty image response")
             
-            # Save to file if output path is provided
-            if output_path:
-                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, "wb") as f:
-                    f.write(image_bytes)
-                print(f"Image saved to: {output_path}")
-            
             return image_bytes
             
         except requests.exceptions.HTTPError as e:
@@ -583,23 +970,188 @@ class BioUtilsClient:
                 f"Request failed: {str(e)}"
             ) from e
     
+    def _stream_to_file(self, response: requests.Response, output_path: Path):
+        """
+        Stream a response body to output_path.
+        
+        The body goes to a temporary file next to output_path that replaces
+        it only once complete, so a failed or empty download never leaves a
+        truncated image behind.
+        
+        Raises:
+            requests.RequestException: If reading the response fails
+            ValueError: If the response is empty
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Unique per process and thread, so concurrent downloads of the
+        # same image never share a temporary file
+        part_path = output_path.with_name(
+            f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.part"
+        )
+        try:
+            image_size = 0
+            with open(part_path, "wb", buffering=1 << 20) as f:
+                for chunk in response.iter_content(65536):
+                    f.write(chunk)
+                    image_size += len(chunk)
+            
+            if not image_size:
+                raise ValueError("Received empty image response")
+            
+            os.replace(part_path, output_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+    
+    def convert_iso_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Optional[bytes]]:
+        """
+        Convert several ISO19794 records to images in a single round trip.
+        
+        Uses the service batch endpoint. If the service does not provide
+        it, or the batch request fails as a whole, the items are converted
+        with concurrent single requests over the pooled session instead,
+        so only the items that fail on their own are skipped.
+        
+        Args:
+            items: List of dicts with keys modality, iso_version, either
+                   iso_bytes or iso_base64 (Base64 text without line breaks)
+                   and optionally compression_ratio (default 95)
+        
+        Returns:
+            Image bytes (JPEG/PNG) for each item in order, or None where
+            the item could not be converted
+        
+        Raises:
+            ValueError: If an item is invalid
+        """
+        if not items:
+            return []
+        
+        # Validate every item, however the items end up being converted
+        modalities = [
+            self._validate_request(item["modality"], item.get("compression_ratio", 95))
+            for item in items
+        ]
+        
+        if not self._batch_supported:
+            return self._collect_concurrently(items)
+        
+        payload_items = [
+            {
+                "modality": modality_upper,
+                "isoVersion": item["iso_version"],
+                "isoBase64": item["iso_base64"] if "iso_base64" in item else _b64encode_str(item["iso_bytes"]),
+                "compressionRatio": item.get("compression_ratio", 95)
+            }
+            for item, modality_upper in zip(items, modalities)
+        ]
+        
+        try:
+            # The service converts at most one batch item per processor at
+            # a time, so the read timeout grows with the number of items
+            response = self.session.post(
+                self._batch_url,
+                json={"items": payload_items},
+                timeout=(self.timeout, self.timeout * len(items))
+            )
+        except requests.exceptions.RequestException:
+            # Timed out or broke off, convert the items one by one instead
+            return self._collect_concurrently(items)
+        
+        # Older services have no batch endpoint
+        if response.status_code in (404, 405):
+            self._batch_supported = False
+            return self._collect_concurrently(items)
+        
+        # Any other failure, such as a proxy body size limit (413), a
+        # rejected item (400) or a server error, falls back to converting
+        # the items one by one
+        if not response.ok:
+            return self._collect_concurrently(items)
+        
+        try:
+            data = response.json()
+            images = data.get("images") if isinstance(data, dict) else None
+            if not isinstance(images, list) or len(images) != len(items):
+                raise ValueError("Received invalid batch response")
+            
+            return [_b64.b64decode(image) if image else None for image in images]
+        except ValueError:
+            return self._collect_concurrently(items)
+    
+    def _collect_concurrently(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Optional[bytes]]:
+        """Convert items concurrently, returning images in item order"""
+        images = [None] * len(items)
+        for index, image_bytes in self._convert_iso_concurrently(items):
+            images[index] = image_bytes
+        return images
+    
+    def _convert_iso_concurrently(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[int, Optional[bytes]]]:
+        """
+        Convert items with parallel single requests over the pooled session.
+        
+        Yields (index, image_bytes) as each conversion completes, with None
+        as image_bytes for items that failed.
+        """
+        if not items:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            futures = {
+                executor.submit(self._convert_one, item): index
+                for index, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                try:
+                    image_bytes = future.result()
+                except Exception:
+                    image_bytes = None
+                yield futures[future], image_bytes
+    
+    def _convert_one(self, item: Dict[str, Any]) -> Optional[bytes]:
+        """Convert a single batch item, keeping Base64 items encoded"""
+        if "iso_base64" in item:
+            return self.convert_iso_b64_to_image(
+                item["modality"], item["iso_version"], item["iso_base64"],
+                item.get("compression_ratio", 95)
+            )
+        return self.convert_iso_to_image(**item)
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Check if the Bio Utils service is healthy
         
+        A healthy result is reused for a few seconds, unhealthy results
+        are never cached.
+        
         Returns:
             Health status dictionary
         """
-        url = f"{self.base_url}/bio-utils/health"
+        if self._health is not None:
+            checked_at, result = self._health
+            if time.monotonic() - checked_at < _HEALTH_TTL:
+                return dict(result)
         
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(self._health_url, timeout=self.timeout)
             response.raise_for_status()
-            return {
+            result = {
                 "status": "healthy",
                 "message": response.text,
                 "status_code": response.status_code
             }
+            self._health = (time.monotonic(), result)
+            return dict(result)
         except requests.exceptions.RequestException as e:
             return {
                 "status": "unhealthy",
@@ -608,7 +1160,7 @@ class BioUtilsClient:
     
     def convert_cbeff_xml_all_birs(
         self,
-        cbeff_xml: str,
+        cbeff_xml: Union[str, bytes, BinaryIO],
         output_dir: str = ".",
         compression_ratio: int = 95,
         file_extension: str = "jpg"
@@ -618,7 +1170,8 @@ class BioUtilsClient:
         Files are named using the subtype from BDBInfo.
         
         Args:
-            cbeff_xml: CBEFF XML content as string
+            cbeff_xml: CBEFF XML content as string or bytes, or a binary file
+                       object positioned at the start of the document
             output_dir: Directory to save output images (default: current directory)
             compression_ratio: Compression ratio (1-100, default 95)
             file_extension: Output file extension (default: "jpg")
@@ -630,111 +1183,39 @@ class BioUtilsClient:
             ValueError: If CBEFF XML parsing fails
             requests.RequestException: If the request fails
         """
-        import os
-        from pathlib import Path
-        
         try:
-            # Parse XML
-            root = ET.fromstring(cbeff_xml)
-            
-            # Extract namespace from root element if present
-            namespace = None
-            if root.tag.startswith('{'):
-                namespace = root.tag[1:root.tag.index('}')]
-            
-            # Define namespace map for find operations
-            ns_map = {}
-            if namespace:
-                ns_map['ns'] = namespace
-            
-            # Helper function to find elements with or without namespace
-            def find_with_ns(parent, tag, direct_child=False):
-                """Find element handling namespace"""
-                search_paths = []
-                if direct_child:
-                    if namespace:
-                        search_paths.append(f'{{{namespace}}}{tag}')
-                        if ns_map:
-                            search_paths.append(f'ns:{tag}')
-                    search_paths.append(tag)
-                else:
-                    if namespace:
-                        search_paths.append(f'.//{{{namespace}}}{tag}')
-                        if ns_map:
-                            search_paths.append(f'.//ns:{tag}')
-                    search_paths.append(f'.//{tag}')
-                
-                for path in search_paths:
-                    if ns_map and 'ns:' in path:
-                        result = parent.find(path, ns_map)
-                    else:
-                        result = parent.find(path)
-                    if result is not None:
-                        return result
-                return None
-            
-            # Find all BIR elements
-            bir_elements = []
-            if namespace:
-                bir_elements = root.findall(f'.//{{{namespace}}}BIR')
-                if not bir_elements and ns_map:
-                    bir_elements = root.findall('.//ns:BIR', ns_map)
-            if not bir_elements:
-                bir_elements = root.findall('.//BIR')
-            
-            if not bir_elements:
-                raise ValueError("No BIR elements found in CBEFF XML")
-            
-            # Create output directory if it doesn't exist
             output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
             
-            results = {}
-            processed_count = 0
-            
-            # Process each BIR element
-            for bir_idx, bir in enumerate(bir_elements):
+            # Conversion items and their (subtype, output file) targets
+            items = []
+            targets = []
+            bir_count = 0
+            
+            # Qualified tag names, resolved again only if a BIR
+            # does not share the namespace of the one before
+            bir_tag = None
+            q = None
+            
+            # Stream BIR elements, each is freed once collected
+            for bir_idx, bir in enumerate(_iterparse_birs(cbeff_xml)):
+                bir_count += 1
+                if bir.tag != bir_tag:
+                    bir_tag = bir.tag
+                    q = _qnames(_extract_namespace(bir))
+                
                 try:
-                    # Find BDBInfo
-                    bdbinfo = find_with_ns(bir, 'BDBInfo')
-                    if bdbinfo is None:
-                        continue
-                    
-                    # Extract Type (modality)
-                    type_elem = find_with_ns(bdbinfo, 'Type', direct_child=True)
-                    if type_elem is None:
-                        type_elem = find_with_ns(bdbinfo, 'Type', direct_child=False)
-                    
-                    if type_elem is None or not type_elem.text:
-                        continue
-                    
-                    type_text = type_elem.text.strip().upper()
-                    if 'FINGER' in type_text or 'FMR' in type_text:
-                        modality = "FINGER"
-                    elif 'IRIS' in type_text or 'IRI' in type_text:
-                        modality = "IRIS"
-                    elif 'FACE' in type_text or 'FAC' in type_text:
-                        modality = "FACE"
-                    else:
-                        continue
-                    
-                    # Extract Subtype
-                    subtype_elem = find_with_ns(bdbinfo, 'Subtype', direct_child=True)
-                    if subtype_elem is None:
-                        subtype_elem = find_with_ns(bdbinfo, 'Subtype', direct_child=False)
+                    bdb_text, modality, iso_version, subtype = self._read_bir_element(bir, q)
                     
-                    if subtype_elem is not None and subtype_elem.text:
-                        subtype = subtype_elem.text.strip()
-                        # Handle "None" as empty
-                        if subtype.upper() == "NONE" or not subtype:
-                            subtype = None
-                    else:
-                        subtype = None
+                    # Pass the BDB through still Base64 encoded. The service
+                    # decoder rejects whitespace, so drop any line breaks
+                    iso_base64 = "".join(bdb_text.split())
+                    if not iso_base64:
+                        raise ValueError("BDB contains no data")
                     
                     # Create filename from subtype or use modality + index
                     if subtype:
-                        safe_subtype = re.sub(r'[^\w\s-]', '', subtype)
-                        safe_subtype = re.sub(r'[-\s]+', '_', safe_subtype)
+                        safe_subtype = _UNSAFE_FILENAME_CHARS.sub('', subtype)
+                        safe_subtype = _FILENAME_SEPARATORS.sub('_', safe_subtype)
                         safe_subtype = safe_subtype.strip('_')
                     else:
                         safe_subtype = f"{modality}_{bir_idx + 1}"
@@ -742,66 +1223,63 @@ class BioUtilsClient:
                     if not safe_subtype:
                         safe_subtype = f"{modality}_{bir_idx + 1}"
                     
-                    # Find BDB element
-                    bdb = find_with_ns(bir, 'BDB')
-                    if bdb is None or not bdb.text:
-                        continue
-                    
-                    # Extract and decode ISO bytes
-                    bdb_base64 = bdb.text.strip()
-                    try:
-                        iso_bytes = base64.b64decode(bdb_base64, validate=True)
-                    except Exception as e:
-                        continue
-                    
-                    if len(iso_bytes) == 0:
-                        continue
-                    
-                    # Determine ISO version
-                    iso_version = "ISO19794_4_2011"
-                    if modality == "IRIS":
-                        iso_version = "ISO19794_6_2011"
-                    elif modality == "FACE":
-                        iso_version = "ISO19794_5_2011"
-                    
-                    # Convert to image
-                    image_bytes = self.convert_iso_to_image(
-                        modality=modality,
-                        iso_version=iso_version,
-                        iso_bytes=iso_bytes,
-                        compression_ratio=compression_ratio
-                    )
-                    
-                    # Save with subtype as filename
-                    output_file = output_path / f"{safe_subtype}.{file_extension}"
-                    with open(output_file, "wb") as f:
-                        f.write(image_bytes)
-                    
-                    results[subtype] = str(output_file)
-                    processed_count += 1
+                    items.append({
+                        "modality": modality,
+                        "iso_version": iso_version,
+                        "iso_base64": iso_base64,
+                        "compression_ratio": compression_ratio
+                    })
+                    targets.append((subtype, output_path / f"{safe_subtype}.{file_extension}"))
                     
                 except Exception as e:
                     # Log error but continue with next BIR
                     continue
             
-            if processed_count == 0:
+            if bir_count == 0:
+                raise ValueError("No BIR elements found in CBEFF XML")
+            
+            if not items:
+                raise ValueError("No valid BIR elements with BDB data found in CBEFF XML")
+            
+            # Create output directory if it doesn't exist
+            output_path.mkdir(parents=True, exist_ok=True)
+            
+            # Convert all BIRs in a single round trip, or with concurrent
+            # requests written out as they complete if there is no batch endpoint
+            if self._batch_supported:
+                converted = enumerate(self.convert_iso_batch(items))
+            else:
+                converted = self._convert_iso_concurrently(items)
+            
+            results = {}
+            for index, image_bytes in converted:
+                if image_bytes is None:
+                    continue
+                
+                # Save with subtype as filename
+                subtype, output_file = targets[index]
+                output_file.write_bytes(image_bytes)
+                
+                results[subtype] = str(output_file)
+            
+            if not results:
                 raise ValueError("No valid BIR elements with BDB data found in CBEFF XML")
             
             return results
             
-        except ET.ParseError as e:
+        except _et().ParseError as e:
             raise ValueError(f"Invalid XML format: {str(e)}")
         except Exception as e:
             raise ValueError(f"Failed to process CBEFF XML: {str(e)}") from e
     
     def convert_cbeff_to_image(
         self,
-        cbeff_base64: str,
+        cbeff_base64: Union[str, bytes],
         modality: Optional[str] = None,
         iso_version: Optional[str] = None,
         compression_ratio: int = 95,
         output_path: Optional[str] = None
-    ) -> bytes:
+    ) -> Optional[bytes]:
         """
         Convert CBEFF to JPEG/PNG image.
         Automatically extracts ISO bytes and modality from CBEFF.
@@ -811,7 +1289,8 @@ class BioUtilsClient:
         2. Base64 encoded binary CBEFF - decodes and extracts ISO bytes
         
         Args:
-            cbeff_base64: CBEFF XML content or base64 encoded CBEFF file
+            cbeff_base64: CBEFF XML content or base64 encoded CBEFF file,
+                          as string or bytes
             modality: Optional modality override (FINGER, IRIS, or FACE).
                      If not provided, will be extracted from CBEFF.
             iso_version: Optional ISO version override.
@@ -820,7 +1299,7 @@ class BioUtilsClient:
             output_path: Optional path to save the image file
         
         Returns:
-            Image bytes (JPEG/PNG)
+            Image bytes (JPEG/PNG), or None if the image was saved to output_path
         
         Raises:
             ValueError: If CBEFF parsing fails or modality cannot be determined
@@ -829,9 +1308,10 @@ class BioUtilsClient:
         # Parse CBEFF to extract ISO bytes and modality
         iso_bytes, detected_modality, detected_version = self.parse_cbeff(cbeff_base64)
         
-        # Use provided values or fall back to detected values
-        final_modality = modality.upper() if modality else detected_modality
-        final_version = iso_version if iso_version else detected_version
+        # Use provided values or fall back to detected values, the
+        # modality is normalised to upper case by convert_iso_to_image
+        final_modality = modality or detected_modality
+        final_version = iso_version or detected_version
         
         # Convert using extracted ISO bytes
         return self.convert_iso_to_image(
@@ -849,7 +1329,7 @@ class BioUtilsClient:
         iso_version: Optional[str] = None,
         output_path: Optional[str] = None,
         compression_ratio: int = 95
-    ) -> bytes:
+    ) -> Optional[bytes]:
         """
         Convert CBEFF file to image.
         Supports both XML format and base64 encoded binary CBEFF files.
@@ -862,14 +1342,14 @@ class BioUtilsClient:
             compression_ratio: Compression ratio (1-100)
         
         Returns:
-            Image bytes
+            Image bytes, or None if the image was saved to output_path
         """
-        # Read CBEFF file
+        # Read CBEFF file as bytes, which parse_cbeff takes without decoding
         try:
-            with open(cbeff_file_path, "r", encoding='utf-8') as f:
-                cbeff_content = f.read().strip()
+            with open(cbeff_file_path, "rb") as f:
+                cbeff_content = f.read()
             
-            if not cbeff_content:
+            if not cbeff_content or cbeff_content.isspace():
                 raise ValueError(f"CBEFF file is empty: {cbeff_file_path}")
             
         except FileNotFoundError:
@@ -909,25 +1389,44 @@ class BioUtilsClient:
             ValueError: If CBEFF XML parsing fails
             requests.RequestException: If the request fails
         """
-        # Read CBEFF XML file
+        # Map CBEFF XML file so the parser reads it without copying it into memory
         try:
-            with open(cbeff_file_path, "r", encoding='utf-8') as f:
-                cbeff_xml = f.read().strip()
-            
-            if not cbeff_xml:
-                raise ValueError(f"CBEFF file is empty: {cbeff_file_path}")
+            with open(cbeff_file_path, "rb") as f:
+                cbeff_data = None
+                
+                # Only non-empty regular files can be mapped, pipes and
+                # devices such as /dev/stdin are read instead
+                file_stat = os.fstat(f.fileno())
+                if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size:
+                    try:
+                        cbeff_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError):
+                        pass
+                
+                if cbeff_data is None:
+                    cbeff_data = f.read()
             
         except FileNotFoundError:
             raise FileNotFoundError(f"CBEFF file not found: {cbeff_file_path}")
         except Exception as e:
             raise ValueError(f"Error reading CBEFF file: {str(e)}")
         
-        return self.convert_cbeff_xml_all_birs(
-            cbeff_xml=cbeff_xml,
-            output_dir=output_dir,
-            compression_ratio=compression_ratio,
-            file_extension=file_extension
-        )
+        # The parser reads the mapping directly, read data through a file object
+        cbeff_xml = cbeff_data if isinstance(cbeff_data, mmap.mmap) else io.BytesIO(cbeff_data)
+        
+        with cbeff_xml:
+            # Start parsing at the first non-whitespace character
+            content = _NON_WHITESPACE.search(cbeff_data)
+            if content is None:
+                raise ValueError(f"Error reading CBEFF file: CBEFF file is empty: {cbeff_file_path}")
+            cbeff_xml.seek(content.start())
+            
+            return self.convert_cbeff_xml_all_birs(
+                cbeff_xml=cbeff_xml,
+                output_dir=output_dir,
+                compression_ratio=compression_ratio,
+                file_extension=file_extension
+            )
     
     def convert_from_file(
         self,
@@ -936,7 +1435,7 @@ class BioUtilsClient:
         iso_version: str,
         output_path: str,
         compression_ratio: int = 95
-    ) -> bytes:
+    ) -> Optional[bytes]:
         """
         Convert ISO file to image file
         
@@ -948,7 +1447,7 @@ class BioUtilsClient:
             compression_ratio: Compression ratio (1-100)
         
         Returns:
-            Image bytes
+            Image bytes, or None if the image was saved to output_path
         """
         # Read ISO file
         with open(iso_file_path, "rb") as f:
@@ -962,6 +1461,47 @@ class BioUtilsClient:
             compression_ratio=compression_ratio,
             output_path=output_path
         )
+    
+    async def convert_from_file_async(
+        self,
+        iso_file_path: str,
+        modality: str,
+        iso_version: str,
+        output_path: str,
+        compression_ratio: int = 95
+    ) -> Optional[bytes]:
+        """
+        Convert ISO file to image file without blocking the event loop.
+        
+        Runs convert_from_file in the loop's default executor over the
+        pooled session, so conversions awaited together with
+        asyncio.gather run concurrently.
+        
+        Args:
+            iso_file_path: Path to input ISO file
+            modality: Biometric modality (FINGER, IRIS, or FACE)
+            iso_version: ISO version
+            output_path: Path to save output image
+            compression_ratio: Compression ratio (1-100)
+        
+        Returns:
+            Image bytes, or None if the image was saved to output_path
+        """
+        # Imported here, asyncio is slow to import and only needed by async callers
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.convert_from_file,
+                iso_file_path=iso_file_path,
+                modality=modality,
+                iso_version=iso_version,
+                output_path=output_path,
+                compression_ratio=compression_ratio
+            )
+        )
 
 
 def main():
@@ -1060,7 +1600,7 @@ def main():
             
             if args.format == "cbeff":
                 # CBEFF format (base64 encoded or XML)
-                image_bytes = client.convert_cbeff_from_file(
+                client.convert_cbeff_from_file(
                     cbeff_file_path=args.input,
                     modality=args.modality,
                     iso_version=args.iso_version,
@@ -1076,7 +1616,7 @@ def main():
                     print("Error: --iso-version is required for ISO format")
                     return 1
                 
-                image_bytes = client.convert_from_file(
+                client.convert_from_file(
                     iso_file_path=args.input,
                     modality=args.modality,
                     iso_version=args.iso_version,
@@ -1084,7 +1624,7 @@ def main():
                     compression_ratio=args.compression
                 )
             
-            print(f"Success! Image size: {len(image_bytes)} bytes")
+            print(f"Success! Image size: {Path(args.output).stat().st_size} bytes")
             
     except Exception as e:
         print(f"Error: {e}")
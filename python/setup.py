@@ -0,0 +1,16 @@
+"""
+Build the optional native CBEFF scanner used by bio_utils_client:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The client falls back to pure Python when the extension is not built.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="bio-utils-client-native",
+    ext_modules=cythonize("_cbeff_parse.pyx", language_level=3),
+)
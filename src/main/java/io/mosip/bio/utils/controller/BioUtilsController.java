@@ -1,5 +1,7 @@
 package io.mosip.bio.utils.controller;
 
+import io.mosip.bio.utils.dto.BioBatchConvertRequest;
+import io.mosip.bio.utils.dto.BioBatchConvertResponse;
 import io.mosip.bio.utils.dto.BioConvertRequest;
 import io.mosip.bio.utils.dto.ErrorResponse;
 import io.mosip.bio.utils.service.BioUtilsService;
@@ -12,7 +14,14 @@ import org.springframework.http.ResponseEntity;
 import org.springframework.validation.annotation.Validated;
 import org.springframework.web.bind.annotation.*;
 
+import javax.annotation.PreDestroy;
 import javax.validation.Valid;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.List;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
 
 /**
  * REST Controller for MOSIP Bio Utils
@@ -26,9 +35,21 @@ public class BioUtilsController {
 
     private static final Logger logger = LoggerFactory.getLogger(BioUtilsController.class);
 
+    /**
+     * Maximum batch items converted at once across all batch requests
+     */
+    private static final int BATCH_PARALLELISM = Runtime.getRuntime().availableProcessors();
+
+    private final ExecutorService batchExecutor = Executors.newFixedThreadPool(BATCH_PARALLELISM);
+
     @Autowired
     private BioUtilsService bioUtilsService;
 
+    @PreDestroy
+    public void shutdownBatchExecutor() {
+        batchExecutor.shutdown();
+    }
+
     /**
      * Convert ISO19794 biometric data to JPEG/PNG image
      * 
@@ -75,6 +96,118 @@ public class BioUtilsController {
         }
     }
 
+    /**
+     * Convert raw ISO19794 bytes to JPEG/PNG image
+     * 
+     * Same as /iso-to-image but takes the ISO bytes as the request body,
+     * avoiding the Base64 encoding overhead.
+     * 
+     * @param modality FINGER, IRIS, or FACE
+     * @param isoVersion ISO version (e.g., ISO19794_4_2011, ISO19794_6_2011)
+     * @param compressionRatio Compression ratio (1-100, default 95)
+     * @param isoBytes ISO bytes
+     * @return JPEG/PNG image bytes
+     */
+    @PostMapping(value = "/iso-to-image/raw",
+            consumes = MediaType.APPLICATION_OCTET_STREAM_VALUE,
+            produces = MediaType.IMAGE_JPEG_VALUE)
+    public ResponseEntity<?> convertRawIsoToImage(
+            @RequestParam String modality,
+            @RequestParam String isoVersion,
+            @RequestParam(defaultValue = "95") int compressionRatio,
+            @RequestBody byte[] isoBytes) {
+        try {
+            logger.info("Received raw conversion request for modality: {}", modality);
+
+            if (compressionRatio < 1 || compressionRatio > 100) {
+                throw new IllegalArgumentException("Compression ratio must be between 1 and 100");
+            }
+
+            byte[] imageBytes = bioUtilsService.convertIsoToImage(
+                modality,
+                isoVersion,
+                isoBytes,
+                compressionRatio
+            );
+
+            logger.info("Successfully converted ISO to image. Image size: {} bytes", imageBytes.length);
+
+            return ResponseEntity.ok()
+                    .header("Content-Type", MediaType.IMAGE_JPEG_VALUE)
+                    .body(imageBytes);
+
+        } catch (IllegalArgumentException e) {
+            logger.error("Invalid request: {}", e.getMessage());
+            ErrorResponse error = new ErrorResponse(
+                HttpStatus.BAD_REQUEST.value(),
+                "Bad Request",
+                e.getMessage(),
+                "/bio-utils/iso-to-image/raw"
+            );
+            return ResponseEntity.badRequest().body(error);
+
+        } catch (Exception e) {
+            logger.error("Error converting ISO to image", e);
+            ErrorResponse error = new ErrorResponse(
+                HttpStatus.INTERNAL_SERVER_ERROR.value(),
+                "Internal Server Error",
+                "Failed to convert ISO to image: " + e.getMessage(),
+                "/bio-utils/iso-to-image/raw"
+            );
+            return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).body(error);
+        }
+    }
+
+    /**
+     * Convert several ISO19794 records to images in a single round trip
+     * 
+     * Items are converted independently and in parallel, bounded by the
+     * number of available processors; a failed item yields a null entry
+     * instead of failing the whole batch.
+     * 
+     * @param request BioBatchConvertRequest containing the items to convert
+     * @return Base64 encoded images in request order
+     */
+    @PostMapping(value = "/iso-to-image/batch", produces = MediaType.APPLICATION_JSON_VALUE)
+    public ResponseEntity<?> convertIsoToImageBatch(@Valid @RequestBody BioBatchConvertRequest request) {
+        logger.info("Received batch conversion request with {} items", request.getItems().size());
+
+        List<CompletableFuture<String>> conversions = new ArrayList<>(request.getItems().size());
+        for (BioConvertRequest item : request.getItems()) {
+            conversions.add(CompletableFuture.supplyAsync(() -> convertBatchItem(item), batchExecutor));
+        }
+
+        // Collect in request order
+        List<String> images = new ArrayList<>(conversions.size());
+        for (CompletableFuture<String> conversion : conversions) {
+            images.add(conversion.join());
+        }
+
+        return ResponseEntity.ok(new BioBatchConvertResponse(images));
+    }
+
+    /**
+     * Convert a single batch item
+     * 
+     * @param item Batch item
+     * @return Base64 encoded image, or null if the item could not be converted
+     */
+    private String convertBatchItem(BioConvertRequest item) {
+        try {
+            byte[] imageBytes = bioUtilsService.convertIsoToImage(
+                item.getModality(),
+                item.getIsoVersion(),
+                item.getIsoBase64(),
+                item.getCompressionRatio()
+            );
+            return Base64.getEncoder().encodeToString(imageBytes);
+
+        } catch (Exception e) {
+            logger.error("Error converting batch item for modality {}: {}", item.getModality(), e.getMessage());
+            return null;
+        }
+    }
+
     /**
      * Health check endpoint
      */
@@ -0,0 +1,24 @@
+package io.mosip.bio.utils.dto;
+
+import javax.validation.Valid;
+import javax.validation.constraints.NotEmpty;
+import java.util.List;
+
+/**
+ * Request DTO for converting several ISO records in one call
+ */
+public class BioBatchConvertRequest {
+
+    @NotEmpty(message = "At least one item is required")
+    @Valid
+    private List<BioConvertRequest> items;
+
+    // Getters and Setters
+    public List<BioConvertRequest> getItems() {
+        return items;
+    }
+
+    public void setItems(List<BioConvertRequest> items) {
+        this.items = items;
+    }
+}
@@ -0,0 +1,30 @@
+package io.mosip.bio.utils.dto;
+
+import java.util.List;
+
+/**
+ * Response DTO for batch ISO to image conversion
+ *
+ * Images are Base64 encoded and returned in request order.
+ * An entry is null when its item could not be converted.
+ */
+public class BioBatchConvertResponse {
+
+    private List<String> images;
+
+    public BioBatchConvertResponse() {
+    }
+
+    public BioBatchConvertResponse(List<String> images) {
+        this.images = images;
+    }
+
+    // Getters and Setters
+    public List<String> getImages() {
+        return images;
+    }
+
+    public void setImages(List<String> images) {
+        this.images = images;
+    }
+}
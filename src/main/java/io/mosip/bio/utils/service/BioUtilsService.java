@@ -30,10 +30,29 @@ public class BioUtilsService {
      * @return Image bytes (JPEG/PNG)
      */
     public byte[] convertIsoToImage(String modality, String isoVersion, String isoBase64, int compressionRatio) {
+        byte[] isoBytes;
         try {
             // Decode Base64
-            byte[] isoBytes = Base64.getDecoder().decode(isoBase64);
-            
+            isoBytes = Base64.getDecoder().decode(isoBase64);
+        } catch (IllegalArgumentException e) {
+            logger.error("Invalid request: {}", e.getMessage());
+            throw e;
+        }
+
+        return convertIsoToImage(modality, isoVersion, isoBytes, compressionRatio);
+    }
+
+    /**
+     * Convert raw ISO19794 bytes to image
+     * 
+     * @param modality FINGER, IRIS, or FACE
+     * @param isoVersion ISO version (e.g., ISO19794_4_2011, ISO19794_6_2011)
+     * @param isoBytes ISO bytes
+     * @param compressionRatio Compression ratio (1-100, default 95)
+     * @return Image bytes (JPEG/PNG)
+     */
+    public byte[] convertIsoToImage(String modality, String isoVersion, byte[] isoBytes, int compressionRatio) {
+        try {
             if (isoBytes == null || isoBytes.length == 0) {
                 throw new IllegalArgumentException("ISO bytes are empty");
             }